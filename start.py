@@ -9,16 +9,13 @@ Starts all components for the RemoteDevelop environment:
 import os
 import time
 import subprocess
-import signal
 import sys
-from pathlib import Path
 
 def kill_existing():
     """Kill any running instances."""
     print("🧹 Cleaning up old processes...")
-    subprocess.run("pkill -9 -f 'webtmux'", shell=True)
-    subprocess.run("pkill -9 -f 'telegram_bridge'", shell=True)
-    subprocess.run("pkill -9 -f 'cloudflared'", shell=True)
+    # One pkill for all three; -f takes an extended regex
+    subprocess.run(["pkill", "-9", "-f", "webtmux|telegram_bridge|cloudflared"])
     time.sleep(1)
 
 def start_webtmux():
@@ -11,7 +11,7 @@ import subprocess
 import asyncio
 import logging
 import re
-import signal
+from dotenv import load_dotenv
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 TMUX_PANE = "%0"
 POLL_INTERVAL = 3  # seconds
+MAX_POLL_INTERVAL = 15  # seconds, backoff ceiling while the pane is idle
+poll_interval = POLL_INTERVAL
+poll_wakeup = asyncio.Event()  # set after sending keys to poll without waiting
 last_output_hash = ""
 user_chat_id = None
 tunnel_process = None
@@ -34,6 +37,18 @@ DECISION_PATTERNS = [
 ]
 COMPLETION_PATTERNS = [r"✓.*완료", r"Successfully", r"Done!", r"Created.*file", r"PR.*created"]
 ERROR_PATTERNS = [r"Error:", r"Failed:", r"❌", r"에러", r"실패"]
+ALERT_HEADERS = {"decision": "🔔 *선택 필요*", "complete": "✅ *완료*", "error": "❌ *에러*"}
+
+
+def _combine(patterns: list[str], flags: int = 0) -> re.Pattern:
+    """Join patterns into one alternation so each category is a single scan."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+# Compiled once; detect_needs_attention runs on every poll tick
+DECISION_RE = _combine(DECISION_PATTERNS, re.IGNORECASE | re.MULTILINE)
+COMPLETION_RE = _combine(COMPLETION_PATTERNS, re.IGNORECASE)
+ERROR_RE = _combine(ERROR_PATTERNS)
 
 
 def start_tunnel():
@@ -61,7 +76,7 @@ def start_tunnel():
                     return tunnel_url
         return None
     except Exception as e:
-        logger.error(f"Tunnel error: {e}")
+        logger.error("Tunnel error: %s", e)
         return None
 
 
@@ -74,63 +89,86 @@ def stop_tunnel():
     tunnel_url = None
 
 
-def send_to_tmux(text: str) -> str:
+async def run_tmux(*args: str) -> str:
+    """Run a tmux command without blocking the event loop."""
+    proc = await asyncio.create_subprocess_exec(
+        "tmux", *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, ["tmux", *args], stdout, stderr)
+    return stdout.decode()
+
+
+async def send_to_tmux(text: str) -> str:
+    global poll_interval
+    # tmux treats a trailing ";" in any argument as a command separator
+    if text.endswith(";"):
+        text = text[:-1] + "\\;"
     try:
-        subprocess.run(["tmux", "send-keys", "-t", TMUX_PANE, "-l", text], check=True)
-        subprocess.run(["tmux", "send-keys", "-t", TMUX_PANE, "C-m"], check=True)
+        # One tmux process: type the text, then press Enter
+        await run_tmux("send-keys", "-t", TMUX_PANE, "-l", text, ";", "send-keys", "-t", TMUX_PANE, "C-m")
+        # Claude is about to produce output; drop any idle backoff and poll now
+        poll_interval = POLL_INTERVAL
+        poll_wakeup.set()
         return "✅ Sent"
     except Exception as e:
         return f"❌ Error: {e}"
 
 
-def read_tmux_output(lines: int = 50) -> str:
+async def read_tmux_output(lines: int = 50) -> str:
     try:
-        result = subprocess.run(
-            ["tmux", "capture-pane", "-t", TMUX_PANE, "-p", "-S", f"-{lines}"],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip()
-    except:
+        output = await run_tmux("capture-pane", "-t", TMUX_PANE, "-p", "-S", f"-{lines}")
+        return output.strip()
+    except Exception:
         return ""
 
 
 def detect_needs_attention(output: str) -> tuple[bool, str, str]:
-    for pattern in DECISION_PATTERNS:
-        if re.search(pattern, output, re.IGNORECASE | re.MULTILINE):
-            lines = output.split('\n')[-30:]
-            return True, "decision", '\n'.join(lines)
-    for pattern in COMPLETION_PATTERNS:
-        if re.search(pattern, output, re.IGNORECASE):
-            return True, "complete", '\n'.join(output.split('\n')[-10:])
-    for pattern in ERROR_PATTERNS:
-        if re.search(pattern, output):
-            return True, "error", '\n'.join(output.split('\n')[-15:])
+    if DECISION_RE.search(output):
+        lines = output.split('\n')[-30:]
+        return True, "decision", '\n'.join(lines)
+    if COMPLETION_RE.search(output):
+        return True, "complete", '\n'.join(output.split('\n')[-10:])
+    if ERROR_RE.search(output):
+        return True, "error", '\n'.join(output.split('\n')[-15:])
     return False, "", ""
 
 
+async def send_alert(app, chat_id, text: str):
+    try:
+        await app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
+    except Exception as e:
+        logger.error("Alert error: %s", e)
+
+
 async def poll_claude(app):
-    global last_output_hash, user_chat_id
+    global last_output_hash, user_chat_id, poll_interval
     while True:
-        await asyncio.sleep(POLL_INTERVAL)
+        try:
+            await asyncio.wait_for(poll_wakeup.wait(), poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        poll_wakeup.clear()
         if not user_chat_id:
             continue
         
-        output = read_tmux_output(60)
+        output = await read_tmux_output(60)
         output_hash = hash(output[-500:] if len(output) > 500 else output)
         if output_hash == last_output_hash:
+            # Idle pane: back off exponentially
+            poll_interval = min(poll_interval * 2, MAX_POLL_INTERVAL)
             continue
         last_output_hash = output_hash
+        poll_interval = POLL_INTERVAL
         
         needs_attention, alert_type, message = detect_needs_attention(output)
         if needs_attention:
-            headers = {"decision": "🔔 *선택 필요*", "complete": "✅ *완료*", "error": "❌ *에러*"}
-            header = headers.get(alert_type, "📢 *알림*")
+            header = ALERT_HEADERS.get(alert_type, "📢 *알림*")
             if len(message) > 3000:
                 message = message[-3000:]
-            try:
-                await app.bot.send_message(chat_id=user_chat_id, text=f"{header}\n\n```\n{message}\n```", parse_mode="Markdown")
-            except Exception as e:
-                logger.error(f"Alert error: {e}")
+            # Fire-and-forget so a slow Telegram round trip doesn't delay the next poll
+            app.create_task(send_alert(app, user_chat_id, f"{header}\n\n```\n{message}\n```"))
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -164,14 +202,14 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    output = read_tmux_output(60)
+    output = await read_tmux_output(60)
     if len(output) > 4000:
         output = output[-4000:]
     await update.message.reply_text(f"```\n{output}\n```", parse_mode="Markdown")
 
 
 async def clear(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    result = send_to_tmux("/clear")
+    result = await send_to_tmux("/clear")
     await update.message.reply_text(result)
 
 
@@ -185,7 +223,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     global user_chat_id
     user_chat_id = update.effective_chat.id
     text = update.message.text
-    result = send_to_tmux(text)
+    result = await send_to_tmux(text)
     await update.message.reply_text(result)
 
 
@@ -194,7 +232,6 @@ async def post_init(app):
 
 
 def main():
-    from dotenv import load_dotenv
     load_dotenv()
     
     token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -210,7 +247,8 @@ def main():
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
     
     logger.info("Starting Telegram bot...")
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    # Every handler consumes plain messages; skip fetching other update types
+    app.run_polling(allowed_updates=[Update.MESSAGE])
 
 
 if __name__ == "__main__":